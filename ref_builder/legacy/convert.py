@@ -1,7 +1,8 @@
-import json
 from collections import defaultdict
 from pathlib import Path
 
+import orjson
+
 from ref_builder.console import console
 from ref_builder.legacy.utils import iter_legacy_otus
 from ref_builder.logs import configure_logger
@@ -25,8 +26,8 @@ def convert_legacy_repo(name: str, path: Path, target_path: Path) -> None:
     """
     configure_logger(False)
 
-    with (path / "src" / "meta.json").open() as f:
-        data = json.load(f)
+    with open(path / "src" / "meta.json", "rb") as f:
+        data = orjson.loads(f.read())
 
     repo = Repo.new(
         DataType(data["data_type"]),
@@ -69,9 +69,9 @@ def handle_int_type(ctx: HandleErrorContext) -> ErrorHandledResult:
     field = ctx.error["loc"][-1]
     value = ctx.error["input"]
 
-    result = ErrorHandledResult(
+    message = (
         f"[bold]{field}[/bold] must be an integer. invalid value is "
-        f"[u]{json.dumps(value)}[/u].",
+        f"[u]{json.dumps(value)}[/u]."
     )
 
     if field == "taxid" and ctx.fix:
@@ -85,11 +85,9 @@ def handle_int_type(ctx: HandleErrorContext) -> ErrorHandledResult:
 
         ctx.update_otu({"taxid": int(taxid)})
 
-        result.fixed = True
-
-        return result
+        return ErrorHandledResult(message, True)
 
-    return result
+    return ErrorHandledResult(message)
 
 
 def handle_missing(ctx: HandleErrorContext) -> ErrorHandledResult:
@@ -241,9 +239,9 @@ def handle_string_too_short(ctx: HandleErrorContext) -> ErrorHandledResult:
     input_ = ctx.error["input"]
     min_length = ctx.error["ctx"]["min_length"]
 
-    result = ErrorHandledResult(
+    message = (
         f"[bold]{field}[/bold] must be a string with a minimum length of "
-        f"{min_length}. it currently has a length of [u]{len(input_)}[/u].",
+        f"{min_length}. it currently has a length of [u]{len(input_)}[/u]."
     )
 
     if field == "source_name" and ctx.fix:
@@ -268,9 +266,9 @@ def handle_string_too_short(ctx: HandleErrorContext) -> ErrorHandledResult:
             {"source_name": source.name, "source_type": source.type.lower()},
         )
 
-        result.fixed = True
+        return ErrorHandledResult(message, True)
 
-    return result
+    return ErrorHandledResult(message)
 
 
 def handle_too_short(ctx: HandleErrorContext) -> ErrorHandledResult:
@@ -3,7 +3,7 @@
 from pathlib import Path
 
 from ref_builder.console import console
-from ref_builder.legacy.utils import iter_legacy_otus
+from ref_builder.legacy.utils import iter_legacy_otu_metadata, iter_legacy_otus
 
 
 def check_unique_accessions(path: Path) -> None:
@@ -53,7 +53,7 @@ def check_unique_otu_abbreviations_and_names(path: Path) -> None:
     abbreviations = set()
     names = set()
 
-    for otu in iter_legacy_otus(path / "src"):
+    for otu in iter_legacy_otu_metadata(path / "src"):
         abbreviation = otu["abbreviation"]
 
         if abbreviation:
@@ -99,7 +99,7 @@ class HandleErrorContext:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorHandledResult:
     """The return value for a legacy validation ``ValidationError`` handler."""
 
@@ -132,7 +132,7 @@ def build_legacy_otu(path: Path) -> dict:
         if isolate_dir_path.is_file():
             continue
 
-        with open(isolate_dir_path / "isolate.json") as f:
+        with open(isolate_dir_path / "isolate.json", "rb") as f:
             isolate_data = orjson.loads(f.read())
 
         isolate_data["sequences"] = []
@@ -141,7 +141,7 @@ def build_legacy_otu(path: Path) -> dict:
             if sequence_path.suffix != ".json" or sequence_path.name == "isolate.json":
                 continue
 
-            with open(sequence_path) as f:
+            with open(sequence_path, "rb") as f:
                 sequence_data = orjson.loads(f.read())
 
             isolate_data["sequences"].append(sequence_data)
@@ -260,3 +260,21 @@ def iter_legacy_otus(src_path: Path) -> Generator[dict, None, None]:
         for otu_dir_path in sorted(alpha_dir_path.iterdir()):
             if otu_dir_path.is_dir():
                 yield build_legacy_otu(otu_dir_path)
+
+
+def iter_legacy_otu_metadata(src_path: Path) -> Generator[dict, None, None]:
+    """Iterate over the ``otu.json`` data of all OTUs in a legacy repository.
+
+    Unlike :func:`iter_legacy_otus`, isolate and sequence files are not read.
+
+    :param src_path: The path to the legacy repository.
+    :return: a generator that yields OTU data dictionaries without isolates.
+    """
+    for alpha_dir_path in sorted(src_path.iterdir()):
+        if alpha_dir_path.is_file():
+            continue
+
+        for otu_dir_path in sorted(alpha_dir_path.iterdir()):
+            if otu_dir_path.is_dir():
+                with open(otu_dir_path / "otu.json", "rb") as f:
+                    yield orjson.loads(f.read())
@@ -109,7 +109,7 @@ def validate_legacy_otu(
     :return: a list of error handling results
     """
     try:
-        LegacyOTU(**otu)
+        LegacyOTU.model_validate(otu)
     except ValidationError as e:
         return handle_validation_error(e, fix, ncbi_client, otu)
 
@@ -1,7 +1,7 @@
 """Caching functionality for the NCBIClient."""
 
-import shutil
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 import orjson
 
@@ -22,11 +22,16 @@ class NCBICache:
         self._taxonomy_path.mkdir(exist_ok=True)
 
     def clear(self) -> None:
-        """Clear and reset the cache."""
-        shutil.rmtree(self.path)
+        """Clear and reset the cache.
 
-        self._genbank_path.mkdir(parents=True)
-        self._taxonomy_path.mkdir()
+        Cached files are deleted and any missing cache directories are recreated.
+        """
+        for path in (self._genbank_path, self._taxonomy_path):
+            path.mkdir(exist_ok=True, parents=True)
+
+            for cached_path in path.iterdir():
+                if cached_path.is_file():
+                    cached_path.unlink()
 
     def cache_genbank_record(self, data: dict, accession: str, version: int) -> None:
         """Add a Genbank record from NCBI Nucleotide to the cache.
@@ -35,8 +40,7 @@ class NCBICache:
         :param accession: The NCBI accession of the record
         :param version: The accession's version number
         """
-        with open(self._get_genbank_path(accession, version), "wb") as f:
-            f.write(orjson.dumps(data))
+        self._write(self._get_genbank_path(accession, version), data)
 
     def load_genbank_record(
         self,
@@ -52,13 +56,13 @@ class NCBICache:
         :return: Deserialized Genbank data if file is found in cache, else None
         """
         if not isinstance(version, int):
-            cache_matches = sorted(
+            record_path = max(
                 self._genbank_path.glob(f"{accession}_*.json"),
-                reverse=True,
+                key=lambda path: int(path.stem.rsplit("_", 1)[1]),
+                default=None,
             )
-            if cache_matches:
-                record_path = cache_matches[0]
-            else:
+
+            if record_path is None:
                 return None
 
         else:
@@ -76,8 +80,7 @@ class NCBICache:
         :param data: NCBI Taxonomy record data
         :param taxid: A NCBI Taxonomy id
         """
-        with open(self._get_taxonomy_path(taxid), "wb") as f:
-            f.write(orjson.dumps(data))
+        self._write(self._get_taxonomy_path(taxid), data)
 
     def load_taxonomy(self, taxid: int) -> dict | None:
         """Load a cached NCBI Taxonomy record.
@@ -93,6 +96,30 @@ class NCBICache:
         except FileNotFoundError:
             return None
 
+    @staticmethod
+    def _write(path: Path, data: dict) -> None:
+        """Write ``data`` to ``path`` as JSON.
+
+        The data is written to a uniquely named temporary file in the same directory
+        that then replaces ``path``, so an existing cache file is never truncated or
+        left partially written, even when several processes cache the same record.
+        The temporary file is removed if the write fails.
+
+        :param path: The path to write the data to
+        :param data: The data to write
+        """
+        serialized = orjson.dumps(data)
+
+        with NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            temporary_path = Path(f.name)
+
+        try:
+            temporary_path.write_bytes(serialized)
+            temporary_path.replace(path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+
     def _get_genbank_path(self, accession: str, version: int) -> Path:
         """Get the path to a cached NCBI Genbank record given an accession and version.
 
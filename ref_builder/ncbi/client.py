@@ -74,8 +74,10 @@ class NCBIClient:
             uncached_accessions = []
 
             for accession in accessions:
-                record = self.cache.load_genbank_record(accession)
-                if record is not None:
+                record = self._load_cached_genbank_record(accession)
+                if record is None:
+                    uncached_accessions.append(accession)
+                else:
                     records.append(record)
 
             if records:
@@ -92,10 +94,9 @@ class NCBIClient:
                     uncached_accessions=uncached_accessions,
                 )
 
-        fetch_list = list(
-            set(accessions)
-            - {record.get(GenbankRecordKey.PRIMARY_ACCESSION) for record in records},
-        )
+            fetch_list = list(set(uncached_accessions))
+        else:
+            fetch_list = list(set(accessions))
 
         if fetch_list:
             logger.debug("Fetching accessions...", fetch_list=fetch_list)
@@ -122,6 +123,25 @@ class NCBIClient:
 
         return []
 
+    def _load_cached_genbank_record(self, accession: str) -> dict | None:
+        """Load a cached Genbank record for a versioned or unversioned accession.
+
+        A versioned accession only matches a record cached for that version. An
+        unversioned accession matches the latest cached version.
+
+        :param accession: A versioned or unversioned accession
+        :return: Deserialized Genbank data if found in the cache, else None
+        """
+        try:
+            versioned_accession = Accession.from_string(accession)
+        except ValueError:
+            return self.cache.load_genbank_record(accession)
+
+        return self.cache.load_genbank_record(
+            versioned_accession.key,
+            versioned_accession.version,
+        )
+
     @staticmethod
     def fetch_unvalidated_genbank_records(accessions: Collection[str]) -> list[dict]:
         """Fetch a list of Genbank records given a list of accessions.
@@ -178,7 +178,7 @@ def generate_natural_sort_key(string: str) -> list[int | str]:
 
 def is_refseq(accession_key: str) -> bool:
     """Return True if accession is RefSeq."""
-    return re.match(REFSEQ_ACCESSION_PATTERN, accession_key) is not None
+    return REFSEQ_ACCESSION_PATTERN.match(accession_key) is not None
 
 
 def pad_zeroes(number: int) -> str:
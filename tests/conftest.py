@@ -1,3 +1,5 @@
+import copy
+import os
 import shutil
 from collections.abc import Callable
 from pathlib import Path
@@ -33,10 +35,16 @@ from tests.fixtures.factories import (
 configure_logger(True)
 
 
+@pytest.fixture(scope="session")
+def factory_seed() -> int:
+    """The fixed seed used for the ModelFactory."""
+    return 1
+
+
 @pytest.fixture(autouse=True)
-def _seed_factories() -> None:
+def _seed_factories(factory_seed: int) -> None:
     """Seed the ModelFactory with a fixed seed."""
-    ModelFactory.seed_random(1)
+    ModelFactory.seed_random(factory_seed)
 
 
 @pytest.fixture()
@@ -46,7 +54,7 @@ def uncached_ncbi_client(scratch_ncbi_cache: NCBICache) -> NCBIClient:
     return NCBIClient(ignore_cache=True)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def files_path():
     return Path(__file__).parent / "files"
 
@@ -62,12 +70,20 @@ def empty_repo(tmp_path: Path) -> Repo:
     )
 
 
+@pytest.fixture(scope="session")
+def legacy_otu_template(files_path: Path) -> dict:
+    """The legacy OTU built once per session.
+
+    Read directly from the test files, so tests that only need the OTU data do not
+    pay for copying a scratch legacy repository. Do not mutate; use ``legacy_otu``.
+    """
+    return build_legacy_otu(files_path / "src_v1" / "a" / "abaca_bunchy_top_virus")
+
+
 @pytest.fixture()
-def legacy_otu(legacy_repo_path: Path) -> dict:
-    """A legacy OTU."""
-    return build_legacy_otu(
-        legacy_repo_path / "src" / "a" / "abaca_bunchy_top_virus",
-    )
+def legacy_otu(legacy_otu_template: dict) -> dict:
+    """A legacy OTU that is safe to mutate."""
+    return copy.deepcopy(legacy_otu_template)
 
 
 @pytest.fixture()
@@ -129,60 +145,144 @@ def scratch_path(scratch_repo: Repo) -> Path:
     return scratch_repo.path
 
 
-@pytest.fixture()
-def scratch_repo(tmp_path: Path, scratch_event_store_data: dict[str, dict]) -> Repo:
-    """A prepared scratch repository."""
-    path = tmp_path / "scratch_repo"
+@pytest.fixture(scope="session")
+def build_scratch_repo(
+    scratch_event_store_data: dict[str, dict],
+) -> Callable[[Path], Repo]:
+    """A function that writes the scratch repository events to a path.
+
+    Shared by ``scratch_repo`` and any module-scoped overrides of it, so they build the
+    repository the same way.
+    """
+
+    def func(path: Path) -> Repo:
+        src_path = path / "src"
+        src_path.mkdir(parents=True)
 
-    src_path = path / "src"
-    src_path.mkdir(parents=True)
+        for filename in scratch_event_store_data:
+            with open(src_path / filename, "wb") as f:
+                f.write(orjson.dumps(scratch_event_store_data[filename]))
 
-    for filename in scratch_event_store_data:
-        with open(src_path / filename, "wb") as f:
-            f.write(orjson.dumps(scratch_event_store_data[filename]))
+        (path / ".cache").mkdir(parents=True)
 
-    (path / ".cache").mkdir(parents=True)
+        return Repo(path)
 
-    return Repo(path)
+    return func
 
 
 @pytest.fixture()
-def scratch_repo_contents_path(files_path):
+def scratch_repo(build_scratch_repo: Callable[[Path], Repo], tmp_path: Path) -> Repo:
+    """A prepared scratch repository."""
+    return build_scratch_repo(tmp_path / "scratch_repo")
+
+
+@pytest.fixture(scope="session")
+def scratch_repo_contents_path(files_path: Path) -> Path:
     """The path to the scratch repository's table of contents file."""
     return files_path / "src_test_contents.json"
 
 
+@pytest.fixture(scope="session")
+def user_cache_template_path(
+    files_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """A copy of the preloaded NCBI cache data made once per session.
+
+    It lives in the pytest temporary directory so scratch user caches can hard link
+    to it. Do not modify it.
+    """
+    path = tmp_path_factory.mktemp("user_cache_template") / "ncbi"
+
+    shutil.copytree(files_path / "cache_test", path)
+
+    return path
+
+
+def _link_user_cache(user_cache_template_path: Path, path: Path) -> Path:
+    """Hard link the preloaded NCBI cache template into a user cache at ``path``.
+
+    This is safe because ``NCBICache`` replaces files instead of writing to them in
+    place.
+    """
+    shutil.copytree(user_cache_template_path, path / "ncbi", copy_function=os.link)
+
+    return path
+
+
 @pytest.fixture()
-def scratch_user_cache_path(files_path: Path, tmp_path: Path) -> Path:
+def scratch_user_cache_path(user_cache_template_path: Path, tmp_path: Path) -> Path:
     """A path to a user cache that contains preloaded data.
 
     On Linux, a user cache path would be found at ``~/.cache/ref-builder/ncbi``.
 
+    The cache files are hard linked to a session-wide template instead of copied.
     """
     path = tmp_path / "user_cache"
     path.mkdir()
 
-    shutil.copytree(files_path / "cache_test", path / "ncbi")
+    return _link_user_cache(user_cache_template_path, path)
 
-    return path
 
+@pytest.fixture(scope="module")
+def _module_user_cache(
+    module_mocker: MockerFixture,
+    tmp_path_factory: pytest.TempPathFactory,
+    user_cache_template_path: Path,
+) -> None:
+    """Patch the NCBI cache to use preloaded data shared by all tests in a module.
 
-@pytest.fixture()
+    Backs ``module_scratch_ncbi_cache`` and ``module_scratch_ncbi_client``. Only use it
+    for tests that do not modify the cache.
+    """
+    path = _link_user_cache(
+        user_cache_template_path,
+        tmp_path_factory.mktemp("user_cache"),
+    )
+
+    module_mocker.patch("ref_builder.ncbi.cache.user_cache_directory_path", path)
+
+
+@pytest.fixture(scope="module")
+def module_scratch_ncbi_cache(_module_user_cache: None) -> NCBICache:
+    """A scratch NCBI cache with preloaded data, shared by all tests in a module.
+
+    Use instead of ``scratch_ncbi_cache`` in modules that only read from the cache.
+    """
+    return NCBICache()
+
+
+@pytest.fixture(scope="module")
+def module_scratch_ncbi_client(_module_user_cache: None) -> NCBIClient:
+    """A scratch NCBI client with a preloaded cache, shared by all tests in a module.
+
+    Use instead of ``scratch_ncbi_client`` in modules that only read records that are
+    already in the preloaded cache.
+    """
+    return NCBIClient(ignore_cache=False)
+
+
+@pytest.fixture(scope="session")
 def scratch_event_store_data(
-    pytestconfig,
+    pytestconfig: pytest.Config,
     scratch_repo_contents_path: Path,
-    tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> dict:
-    """Scratch repo events. Cached in .pytest_cache."""
+    """Scratch repo events.
+
+    Cached in .pytest_cache and loaded once per session. Do not mutate.
+    """
     scratch_src = pytestconfig.cache.get("scratch_src", None)
 
     if scratch_src:
         return scratch_src
 
+    path = tmp_path_factory.mktemp("scratch_event_store")
+
     temp_scratch_repo = Repo.new(
         data_type=DataType.GENOME,
         name="src_test",
-        path=tmp_path,
+        path=path,
         organism="viruses",
     )
 
@@ -210,7 +310,7 @@ def scratch_event_store_data(
 
     scratch_src = {}
 
-    for event_file_path in (tmp_path / "src").glob("*.json"):
+    for event_file_path in (path / "src").glob("*.json"):
         with open(event_file_path) as f:
             scratch_src[event_file_path.name] = orjson.loads(f.read())
 
@@ -1,7 +1,11 @@
 """Factories for generating quasi-realistic NCBISource and NCBIGenbank data."""
 
+from collections.abc import Iterable
+from itertools import chain
+from typing import Any
+
 from faker.providers import lorem
-from polyfactory import PostGenerated, Use
+from polyfactory import Ignore, PostGenerated, Use
 from polyfactory.decorators import post_generated
 from polyfactory.factories.pydantic_factory import ModelFactory
 from pydantic.v1 import UUID4
@@ -31,6 +35,36 @@ DNA_MOLTYPES = {
 }
 """NCBISourceMolTypes that map to MolType.DNA"""
 
+NCBI_SOURCE_MOLTYPE_TO_MOLTYPE = {
+    **dict.fromkeys(DNA_MOLTYPES, MolType.DNA),
+    NCBISourceMolType.GENOMIC_RNA: MolType.RNA,
+    NCBISourceMolType.MRNA: MolType.MRNA,
+    NCBISourceMolType.TRANSCRIBED_RNA: MolType.RNA,
+    NCBISourceMolType.VIRAL_CRNA: MolType.CRNA,
+    NCBISourceMolType.TRNA: MolType.TRNA,
+    NCBISourceMolType.OTHER_RNA: MolType.RNA,
+}
+"""Maps each NCBISourceMolType to its MolType equivalent."""
+
+ISOLATE_COMPONENT_FAKERS = (
+    lambda faker: faker.country().replace(" ", ""),
+    lambda faker: faker.last_name(),
+    lambda faker: faker.country_code(),
+    lambda faker: str(faker.random_int(0, 9)),
+    lambda faker: str(faker.random_int(10, 99)),
+    lambda faker: str(faker.random_int(100, 9999)),
+)
+"""Callables that each generate one component of a raw isolate name."""
+
+ISOLATE_DELIMITERS = ("", "-", "_")
+"""Delimiters used to join raw isolate name components."""
+
+CLONE_AND_STRAIN_DELIMITERS = ("-", "_", " ", "/")
+"""Delimiters used to join words in raw clone and strain names."""
+
+SEGMENT_NAME_PREFIXES = ("DNA", "RNA")
+"""Prefixes used in generated segment names."""
+
 
 ModelFactory.__faker__.add_provider(AccessionProvider)
 ModelFactory.__faker__.add_provider(BusinessProvider)
@@ -39,6 +73,12 @@ ModelFactory.__faker__.add_provider(SegmentProvider)
 ModelFactory.__faker__.add_provider(SequenceProvider)
 ModelFactory.__faker__.add_provider(lorem)
 
+ISOLATE_NAME_VALUES = tuple(
+    noun.capitalize()
+    for noun in ModelFactory.__faker__.get_words_list(part_of_speech="noun")
+)
+"""Capitalized nouns used as fake isolate name values."""
+
 
 class NCBISourceFactory(ModelFactory[NCBISource]):
     """NCBISource Factory with quasi-realistic data."""
@@ -49,22 +89,16 @@ class NCBISourceFactory(ModelFactory[NCBISource]):
     @classmethod
     def isolate(cls) -> str:
         """Raw isolate name faker."""
-        if cls.__faker__.boolean(80):
-            delimiter = cls.__faker__.random_element(["", "-", "_"])
-            components = cls.__faker__.random_elements(
-                [
-                    cls.__faker__.country().replace(" ", ""),
-                    cls.__faker__.last_name(),
-                    cls.__faker__.country_code(),
-                    str(cls.__faker__.random_int(0, 9)),
-                    str(cls.__faker__.random_int(10, 99)),
-                    str(cls.__faker__.random_int(100, 9999)),
-                ],
-                2,
-                unique=True,
-            )
+        faker = cls.__faker__
 
-            return delimiter.join(components)
+        if faker.boolean(80):
+            delimiter = faker.random_element(ISOLATE_DELIMITERS)
+
+            # Only call the fakers for the two components that are actually used.
+            return delimiter.join(
+                component_faker(faker)
+                for component_faker in faker.random.sample(ISOLATE_COMPONENT_FAKERS, 2)
+            )
 
         return ""
 
@@ -76,31 +110,37 @@ class NCBISourceFactory(ModelFactory[NCBISource]):
     @classmethod
     def segment(cls) -> str:
         """Raw segment name faker."""
-        if cls.__faker__.boolean(80):
+        faker = cls.__faker__
+
+        if faker.boolean(80):
             return (
-                f"{cls.__faker__.segment_prefix()}"
-                f"{cls.__faker__.segment_delimiter()}"
-                f"{cls.__faker__.segment_key()}"
+                f"{faker.segment_prefix()}"
+                f"{faker.segment_delimiter()}"
+                f"{faker.segment_key()}"
             )
-        return cls.__faker__.segment_key()
+        return faker.segment_key()
 
     @classmethod
     def clone(cls) -> str:
         """Raw clone name faker."""
-        if cls.__faker__.boolean(10):
-            delimiter = cls.__faker__.random_element(["-", "_", " ", "/"])
-            return delimiter.join(cls.__faker__.words(2))
+        faker = cls.__faker__
 
-        return ""
+        if not faker.boolean(10):
+            return ""
+
+        delimiter = faker.random_element(CLONE_AND_STRAIN_DELIMITERS)
+        return delimiter.join(faker.words(2))
 
     @classmethod
     def strain(cls) -> str:
         """Raw strain name faker."""
-        if cls.__faker__.boolean(10):
-            delimiter = cls.__faker__.random_element(["-", "_", " ", "/"])
-            return delimiter.join(cls.__faker__.words(2))
+        faker = cls.__faker__
 
-        return ""
+        if not faker.boolean(10):
+            return ""
+
+        delimiter = faker.random_element(CLONE_AND_STRAIN_DELIMITERS)
+        return delimiter.join(faker.words(2))
 
     proviral = Use(ModelFactory.__faker__.boolean, chance_of_getting_true=5)
     """Pseudorandom proviral flag for DNA records only."""
@@ -128,11 +168,8 @@ class NCBISourceFactory(ModelFactory[NCBISource]):
     @post_generated
     @classmethod
     def transgenic(cls, focus: bool) -> bool:
-        """Transgenic flag set to False if focus is True."""
-        if focus and cls.__faker__.boolean(5):
-            return not focus
-
-        return False
+        """Pseudorandom transgenic flag. Always False if focus is True."""
+        return not focus and cls.__faker__.boolean(5)
 
 
 class NCBIGenbankFactory(ModelFactory[NCBIGenbank]):
@@ -153,62 +190,65 @@ class NCBIGenbankFactory(ModelFactory[NCBIGenbank]):
     @classmethod
     def moltype(cls, source: NCBISource) -> MolType:
         """Map moltype field to source.moltype equivalent."""
-        if source.mol_type in DNA_MOLTYPES:
-            return MolType.DNA
-
         try:
-            return {
-                NCBISourceMolType.GENOMIC_RNA: MolType.RNA,
-                NCBISourceMolType.MRNA: MolType.MRNA,
-                NCBISourceMolType.TRANSCRIBED_RNA: MolType.RNA,
-                NCBISourceMolType.VIRAL_CRNA: MolType.CRNA,
-                NCBISourceMolType.TRNA: MolType.TRNA,
-                NCBISourceMolType.OTHER_RNA: MolType.RNA,
-            }[source.mol_type]
+            return NCBI_SOURCE_MOLTYPE_TO_MOLTYPE[source.mol_type]
         except KeyError as err:
             raise ValueError(
                 f"Source moltype {source.mol_type} cannot be matched to MolType",
             ) from err
 
-    @post_generated
-    @classmethod
-    def organism(cls, source: NCBISource) -> str:
-        """Organism faker."""
-        return source.organism
+    organism = Ignore()
+    """Mirrored from ``source`` in :meth:`_mirror_source`."""
 
     @classmethod
     def sequence(cls) -> str:
         """Sequence faker."""
         return cls.__faker__.sequence()
 
-    @post_generated
     @classmethod
-    def taxid(cls, source: NCBISource) -> int:
-        """Match taxid field to source.taxid."""
-        return source.taxid
+    def process_kwargs(cls, **kwargs: object) -> dict[str, Any]:
+        """Generate field values, then mirror ``organism`` from the source."""
+        return cls._mirror_source(super().process_kwargs(**kwargs))
+
+    @classmethod
+    def process_kwargs_coverage(cls, **kwargs: object) -> Iterable[dict[str, Any]]:
+        """Generate coverage field values, then mirror ``organism`` from the source."""
+        for values in super().process_kwargs_coverage(**kwargs):
+            yield cls._mirror_source(values)
+
+    @staticmethod
+    def _mirror_source(values: dict[str, Any]) -> dict[str, Any]:
+        """Copy ``organism`` from the source unless it was already given."""
+        values.setdefault("organism", values["source"].organism)
+
+        return values
 
 
 def derive_acronym(_: str, values: dict[str, str]) -> str:
     """Derive an acronym from an OTU name."""
     name = values["name"]
+
+    if " " not in name:
+        return name[0].upper()
+
     return "".join([part[0].upper() for part in name.split(" ")])
 
 
 class SegmentFactory(ModelFactory[Segment]):
     """Segment Factory with quasi-realistic data."""
 
-    ModelFactory.__faker__.add_provider(SequenceProvider)
-
     length = Use(ModelFactory.__faker__.sequence_length)
     """Generate a quasi-realistic length for a sequence."""
 
     @classmethod
     def name(cls) -> SegmentName | None:
         """Generate a quasi-realistic segment name or null."""
-        if cls.__faker__.random_int(0, 10) > 5:
+        faker = cls.__faker__
+
+        if faker.boolean(50):
             return SegmentName(
-                prefix=cls.__faker__.random_element(["DNA", "RNA"]),
-                key=cls.__faker__.segment_key(),
+                prefix=faker.random_element(SEGMENT_NAME_PREFIXES),
+                key=faker.segment_key(),
             )
 
         return None
@@ -246,7 +286,7 @@ class PlanFactory(ModelFactory[Plan]):
     def segments(cls) -> list[Segment]:
         """Return a set of quasi-realistic segments."""
         # The segment represent a monopartite OTU 75% of the time.
-        if cls.__faker__.random_int(0, 3):
+        if cls.__faker__.boolean(75):
             return [SegmentFactory.build(name=None, rule=SegmentRule.REQUIRED)]
 
         return SegmentFactory.build_series(cls.__faker__.random_int(2, 5))
@@ -273,8 +313,7 @@ class SequenceFactory(ModelFactory[SequenceBase]):
     @classmethod
     def accession(cls) -> Accession:
         """Generate a quasi-realistic accession."""
-        ModelFactory.__faker__.add_provider(AccessionProvider)
-        return Accession(key=ModelFactory.__faker__.accession(), version=1)
+        return Accession(key=cls.__faker__.accession(), version=1)
 
     @classmethod
     def build_on_segment(
@@ -297,8 +336,6 @@ class SequenceFactory(ModelFactory[SequenceBase]):
 class IsolateFactory(ModelFactory[IsolateBase]):
     """Isolate factory with quasi-realistic data."""
 
-    ModelFactory.__faker__.add_provider(BusinessProvider)
-
     id = Use(ModelFactory.__faker__.uuid4, cast_to=None)
     """Generate a UUID."""
 
@@ -310,17 +347,26 @@ class IsolateFactory(ModelFactory[IsolateBase]):
         """Generate a quasi-realistic isolate name."""
         return IsolateName(
             type=IsolateNameType.ISOLATE,
-            value=cls.__faker__.word(part_of_speech="noun").capitalize(),
+            value=cls.__faker__.random_element(ISOLATE_NAME_VALUES),
         )
 
     @classmethod
     def sequences(cls) -> list[SequenceBase]:
         """Generate between 1 and 6 sequences with numerically sequential accessions."""
-        sequence_count = cls.__faker__.random_int(1, 6)
+        faker = cls.__faker__
+
+        sequence_count = faker.random_int(1, 6)
 
         return [
-            SequenceFactory.build(accession=Accession(key=accession, version=1))
-            for accession in cls.__faker__.accessions(sequence_count)
+            SequenceFactory.build(
+                accession=Accession(key=accession, version=1),
+                sequence=sequence,
+            )
+            for accession, sequence in zip(
+                faker.accessions(sequence_count),
+                faker.sequences(sequence_count),
+                strict=True,
+            )
         ]
 
     @classmethod
@@ -345,9 +391,6 @@ class IsolateFactory(ModelFactory[IsolateBase]):
 class OTUFactory(ModelFactory[OTUBase]):
     """OTU Factory with quasi-realistic data."""
 
-    ModelFactory.__faker__.add_provider(BusinessProvider)
-    ModelFactory.__faker__.add_provider(OrganismProvider)
-
     acronym = PostGenerated(derive_acronym)
     """Generate an acronym for the OTU derived from its name."""
 
@@ -389,7 +432,7 @@ class OTUFactory(ModelFactory[OTUBase]):
     @classmethod
     def sequences(cls, isolates: list[IsolateBase]) -> list[SequenceBase]:
         """Derive a list of sequences from a list of isolates."""
-        return [sequence for isolate in isolates for sequence in isolate.sequences]
+        return list(chain.from_iterable(isolate.sequences for isolate in isolates))
 
     taxid = Use(ModelFactory.__faker__.random_int, min=1000, max=999999)
     """A realistic taxonomy ID."""
@@ -398,9 +441,6 @@ class OTUFactory(ModelFactory[OTUBase]):
 class OTUMinimalFactory(ModelFactory[OTUMinimal]):
     """OTUMinimal Factory with quasi-realistic data."""
 
-    ModelFactory.__faker__.add_provider(BusinessProvider)
-    ModelFactory.__faker__.add_provider(OrganismProvider)
-
     acronym = PostGenerated(derive_acronym)
     """An acronym for the OTU derived from its name."""
 
@@ -1,6 +1,6 @@
 """Organism constants for fake data generation."""
 
-ORGANISM_HOSTS = [
+ORGANISM_HOSTS = (
     "apple",
     "blueberry",
     "faba bean",
@@ -17,9 +17,9 @@ ORGANISM_HOSTS = [
     "sweet potato",
     "tobacco",
     "tomato",
-]
+)
 
-ORGANISM_VIRUSES = [
+ORGANISM_VIRUSES = (
     "ampelovirus",
     "badnavirus",
     "begomocirus",
@@ -32,9 +32,9 @@ ORGANISM_VIRUSES = [
     "potexvirus",
     "pteridovirus",
     "velarivirus",
-]
+)
 
-ORGANISM_PART_AND_DESCRIPTORS = [
+ORGANISM_PART_AND_DESCRIPTORS = (
     "bushy top",
     "bunchy top",
     "flower break",
@@ -43,9 +43,9 @@ ORGANISM_PART_AND_DESCRIPTORS = [
     "leaf crumple",
     "tatter leaf",
     "vein banding",
-]
+)
 
-ORGANISM_DESCRIPTOR_ADJECTIVES = [
+ORGANISM_DESCRIPTOR_ADJECTIVES = (
     "aphid-borne",
     "associated",
     "bacilliform",
@@ -59,9 +59,9 @@ ORGANISM_DESCRIPTOR_ADJECTIVES = [
     "rusty",
     "yellow",
     "severe",
-]
+)
 
-ORGANISM_DESCRIPTOR_NOUNS = [
+ORGANISM_DESCRIPTOR_NOUNS = (
     "clump",
     "chlorosis",
     "dwarf",
@@ -75,18 +75,16 @@ ORGANISM_DESCRIPTOR_NOUNS = [
     "streak",
     "yellows",
     "wilt",
-]
-ORGANISM_PARTS = [
+)
+ORGANISM_PARTS = (
     "leaf",
     "vein",
-]
+)
 
-ORGANISM_TYPES = [
-    "virus",
-]
+ORGANISM_TYPES = ("virus",)
 
-ORGANISM_SPECIFIC_VIRUS_TYPES = [
+ORGANISM_SPECIFIC_VIRUS_TYPES = (
     "alphasatellite",
     "betasatellite",
     "viroid",
-]
+)
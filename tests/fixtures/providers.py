@@ -1,6 +1,8 @@
 """Custom data providers for generating dummy data."""
 
 from collections import OrderedDict
+from itertools import accumulate
+from string import ascii_uppercase
 
 from faker.providers import BaseProvider
 
@@ -38,66 +40,110 @@ NUCLEOTIDE_PROBABILITIES = OrderedDict(
 )
 """Probabilities of each nucleotide appearing in a sequence."""
 
+NUCLEOTIDES = tuple(NUCLEOTIDE_PROBABILITIES)
+"""The nucleotides in ``NUCLEOTIDE_PROBABILITIES``, in order."""
+
+NUCLEOTIDE_CUMULATIVE_WEIGHTS = tuple(accumulate(NUCLEOTIDE_PROBABILITIES.values()))
+"""Cumulative weights of ``NUCLEOTIDE_PROBABILITIES`` for weighted sampling."""
+
 MIN_SEQUENCE_LENGTH = 100
 """Minimum length of a sequence the should be generated."""
 
 MAX_SEQUENCE_LENGTH = 1500
 """Maximum length of a sequence the should be generated."""
 
+ORGANISM_BUILDERS = (
+    "host_adjective_virus_organism",
+    "host_adjective_noun_virus_organism",
+    "host_noun_virus_organism",
+    "host_part_and_descriptor_virus_organism",
+)
+"""Names of the OrganismProvider methods that build organism names."""
+
+ORGANISM_BUILDER_CUMULATIVE_WEIGHTS = (1, 2, 3, 10)
+"""Cumulative weights for ``ORGANISM_BUILDERS``.
+
+HOST PART_AND_DESCRIPTOR VIRUS names are built 70% of the time and each other form
+10% of the time.
+"""
+
+SEGMENT_DELIMITERS = (" ", "-", "_")
+"""Delimiters placed between a segment prefix and key."""
+
+SEGMENT_PREFIXES = ("DNA", "RNA", "Segment")
+"""Prefixes used in raw segment names."""
+
+
+def capitalize_first_letter(string: str) -> str:
+    """Uppercase the first letter of ``string`` and leave the rest unchanged.
+
+    Unlike :meth:`str.capitalize`, this does not lowercase the rest of the string.
+    """
+    return string[:1].upper() + string[1:]
+
 
 class AccessionProvider(BaseProvider):
     """Raw accession provider based on GenBank's guidelines for accession numbers."""
 
     def accession(self) -> str:
         """Return a pseudorandom accession number."""
-        if self.random_int(0, 10) > 7:
+        if self.generator.random.randint(0, 10) > 7:
             return self.genbank_accession()
 
         return self.refseq_accession()
 
     def accessions(self, count: int) -> list[str]:
         """Return a list of pseudorandom, consecutive accession numbers."""
-        if self.random_int(0, 10) > 7:
+        if self.generator.random.randint(0, 10) > 7:
             return self.genbank_accessions(count)
 
         return self.refseq_accessions(count)
 
     def genbank_accession(self) -> str:
         """Return a pseudorandom non-RefSeq accession number."""
-        if self.random_int(0, 10) > 6:
-            return self.bothify("?#####").upper()
+        if self.generator.random.randint(0, 10) > 6:
+            letter_count, digit_count = 1, 5
+        else:
+            letter_count, digit_count = 2, 6
+
+        random = self.generator.random
+
+        prefix = "".join(random.choices(ascii_uppercase, k=letter_count))
 
-        return self.bothify("??######").upper()
+        return f"{prefix}{random.randrange(10**digit_count):0{digit_count}d}"
 
     def genbank_accessions(self, count: int) -> list[str]:
         """Return a list of pseudorandom, consecutive accession numbers."""
-        if self.random_int(0, 10) > 6:
-            prefix = self.random_uppercase_letter()
+        random = self.generator.random
+
+        if random.randint(0, 10) > 6:
+            prefix = random.choice(ascii_uppercase)
 
             ceiling = 99999
 
-            digit_format = "{0:05d}"
+            width = 5
 
         else:
-            prefix = self.random_uppercase_letter() + self.random_uppercase_letter()
+            prefix = random.choice(ascii_uppercase) + random.choice(ascii_uppercase)
 
             ceiling = 999999
 
-            digit_format = "{0:06d}"
+            width = 6
 
-        first_number = self.random_int(0, ceiling - count)
+        first_number = random.randint(0, ceiling - count)
 
         return [
-            f"{prefix}{digit_format.format(first_number + i)}" for i in range(count)
+            f"{prefix}{number:0{width}d}"
+            for number in range(first_number, first_number + count)
         ]
 
     def refseq_accession(self) -> str:
         """Return a pseudorandom RefSeq accession number."""
-        return self.numerify("NC_######")
+        return f"NC_{self.generator.random.randrange(1000000):06d}"
 
     def refseq_accessions(self, count: int) -> list[str]:
         """Return a list of pseudorandom, consecutive RefSeq accession numbers."""
-        first_number = self.random_int(0, 999999 - count)
+        first_number = self.generator.random.randint(0, 999999 - count)
 
         return [f"NC_{(first_number + i):06d}" for i in range(count)]
 
@@ -121,20 +167,52 @@ class SequenceProvider(BaseProvider):
         """Return a pseudorandom string consisting of
         acceptable genetic sequence letters.
         """
-        return "".join(
-            self.random_elements(
-                NUCLEOTIDE_PROBABILITIES,
-                self.random_int(min, max),
-                use_weighting=True,
-            ),
-        )
+        return self._nucleotides(self.generator.random.randint(min, max))
+
+    def sequences(
+        self,
+        count: int,
+        min_length: int = MIN_SEQUENCE_LENGTH,
+        max_length: int = MAX_SEQUENCE_LENGTH,
+    ) -> list[str]:
+        """Return a list of pseudorandom sequences.
+
+        The nucleotides for all sequences are drawn in a single call and then split
+        into sequences of pseudorandom lengths.
+        """
+        lengths = [
+            self.generator.random.randint(min_length, max_length) for _ in range(count)
+        ]
+
+        nucleotides = self._nucleotides(sum(lengths))
+
+        sequences = []
+        offset = 0
+
+        for length in lengths:
+            sequences.append(nucleotides[offset : offset + length])
+            offset += length
+
+        return sequences
 
     def sequence_length(
         self,
         min: int = MIN_SEQUENCE_LENGTH,
         max: int = MAX_SEQUENCE_LENGTH,
     ) -> int:
-        return self.random_int(min, max)
+        return self.generator.random.randint(min, max)
+
+    def _nucleotides(self, count: int) -> str:
+        """Return a string of ``count`` nucleotides drawn with
+        ``NUCLEOTIDE_PROBABILITIES``.
+        """
+        return "".join(
+            self.generator.random.choices(
+                NUCLEOTIDES,
+                cum_weights=NUCLEOTIDE_CUMULATIVE_WEIGHTS,
+                k=count,
+            ),
+        )
 
 
 class OrganismProvider(BaseProvider):
@@ -144,68 +222,67 @@ class OrganismProvider(BaseProvider):
 
     def condition_adjective(self) -> str:
         """Return an adjective used to describe properties of an organism."""
-        return self.random_element(ORGANISM_DESCRIPTOR_ADJECTIVES)
+        return self.generator.random.choice(ORGANISM_DESCRIPTOR_ADJECTIVES)
 
     def condition_noun(self) -> str:
         """Return a noun used to describe properties of an organism."""
-        return self.random_element(ORGANISM_DESCRIPTOR_NOUNS)
+        return self.generator.random.choice(ORGANISM_DESCRIPTOR_NOUNS)
 
     def host(self) -> str:
         """Return the host affected by the organism."""
-        return self.random_element(ORGANISM_HOSTS)
+        return self.generator.random.choice(ORGANISM_HOSTS)
 
     def part(self) -> str:
         """Return the part of the host affected by the organism."""
-        return self.random_element(ORGANISM_PARTS)
+        return self.generator.random.choice(ORGANISM_PARTS)
 
     def virus_species(self) -> str:
         """Return the species of virus."""
-        return self.random_element(ORGANISM_VIRUSES)
+        return self.generator.random.choice(ORGANISM_VIRUSES)
 
     def virus_type(self) -> str:
         """Return the type of organism."""
-        return self.random_element(ORGANISM_TYPES)
+        return self.generator.random.choice(ORGANISM_TYPES)
 
     def host_part_and_descriptor_virus_organism(self) -> str:
         """Return an organism name consisting of HOST PART_AND_DESCRIPTOR VIRUS."""
-        return " ".join(
-            [
-                self.host(),
-                self.random_element(ORGANISM_PART_AND_DESCRIPTORS),
-                self.virus_type(),
-            ],
-        ).capitalize()
+        return capitalize_first_letter(
+            " ".join(
+                (
+                    self.host(),
+                    self.generator.random.choice(ORGANISM_PART_AND_DESCRIPTORS),
+                    self.virus_type(),
+                ),
+            ),
+        )
 
     def host_adjective_virus_organism(self) -> str:
         """Return an organism name consisting of HOST ADJECTIVE VIRUS."""
-        return (
-            f"{self.host()} {self.condition_adjective()} {self.virus_type()}"
-        ).capitalize()
+        return capitalize_first_letter(
+            f"{self.host()} {self.condition_adjective()} {self.virus_type()}",
+        )
 
     def host_noun_virus_organism(self):
         """Return an organism name consisting of HOST NOUN VIRUS."""
-        return (
-            f"{self.host()} {self.condition_noun()} {self.virus_type()}"
-        ).capitalize()
+        return capitalize_first_letter(
+            f"{self.host()} {self.condition_noun()} {self.virus_type()}",
+        )
 
     def host_adjective_noun_virus_organism(self):
         """Return an organism name consisting of HOST ADJECTIVE NOUN VIRUS."""
-        return (
+        return capitalize_first_letter(
             f"{self.host()} {self.condition_adjective()} {self.condition_noun()} "
-            f"{self.virus_type()}"
-        ).capitalize()
+            f"{self.virus_type()}",
+        )
 
     def organism(self):
         """Return a pseudorandom organism name."""
-        match self.random_int(0, 9):
-            case 0:
-                return self.host_adjective_virus_organism()
-            case 1:
-                return self.host_adjective_noun_virus_organism()
-            case 2:
-                return self.host_noun_virus_organism()
-            case _:
-                return self.host_part_and_descriptor_virus_organism()
+        builder_name = self.generator.random.choices(
+            ORGANISM_BUILDERS,
+            cum_weights=ORGANISM_BUILDER_CUMULATIVE_WEIGHTS,
+        )[0]
+
+        return getattr(self, builder_name)()
 
 
 class SegmentProvider(BaseProvider):
@@ -213,11 +290,11 @@ class SegmentProvider(BaseProvider):
 
     def segment_delimiter(self) -> str:
         """Return a segment delimiter."""
-        return self.random_element([" ", "-", "_"])
+        return self.generator.random.choice(SEGMENT_DELIMITERS)
 
     def segment_prefix(self) -> str:
         """Return a segment prefix."""
-        return self.random_element(["DNA", "RNA", "Segment"])
+        return self.generator.random.choice(SEGMENT_PREFIXES)
 
     def segment_key(self) -> str:
         """Return a segment key denoting the key identifier
@@ -225,14 +302,14 @@ class SegmentProvider(BaseProvider):
         """
         key = self.bothify("?#").upper()
 
-        if key[1] == "0" or self.random_int(0, 3) == 2:
+        if key[1] == "0" or self.generator.random.randint(0, 3) == 2:
             return key[0]
 
         return key
 
     def segment(self) -> str:
         """Return a segment name."""
-        if self.random_int(0, 9) < 7:
+        if self.generator.random.randint(0, 9) < 7:
             return self.segment_prefix() + self.segment_delimiter() + self.segment_key()
 
         return self.segment_key()
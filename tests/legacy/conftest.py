@@ -0,0 +1,38 @@
+"""Fixtures shared by the legacy tests."""
+
+from collections.abc import Callable
+from io import StringIO
+
+import pytest
+from pytest_mock import MockerFixture
+from rich.console import Console
+
+
+@pytest.fixture(scope="module")
+def patch_console(module_mocker: MockerFixture) -> Callable[[str, int], Console]:
+    """Return a function that patches a console for the rest of the test module.
+
+    The patched console writes to a StringIO file instead of stdout. The width is fixed
+    so that output does not depend on the terminal or ``COLUMNS``.
+    """
+
+    def func(target: str, width: int) -> Console:
+        console = Console(file=StringIO(), no_color=True, width=width)
+        module_mocker.patch(target, console)
+
+        return console
+
+    return func
+
+
+@pytest.fixture()
+def console(module_console: Console) -> Console:
+    """Clear the patched console's output before each test and return the console.
+
+    Test modules that use it define a module-scoped ``module_console`` fixture that
+    calls ``patch_console``.
+    """
+    module_console.file.seek(0)
+    module_console.file.truncate(0)
+
+    return module_console
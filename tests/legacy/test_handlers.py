@@ -1,5 +1,7 @@
 """Test the validation handlers for legacy OTUs."""
 
+from collections.abc import Callable
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -8,224 +10,139 @@ from ref_builder.legacy.validate import validate_legacy_otu
 from ref_builder.ncbi.client import NCBIClient
 
 
-def test_ok(legacy_otu: dict, scratch_ncbi_client: NCBIClient):
+def test_ok(legacy_otu: dict, module_scratch_ncbi_client: NCBIClient):
     """Test that `None` is returned for a valid legacy OTU."""
     assert (
         validate_legacy_otu(
             True,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
         is None
     )
 
 
-class TestOTU:
-    """Test handlers for OTU validation."""
+def _set_short_name(otu: dict) -> None:
+    """Set a name that is too short."""
+    otu["name"] = "Iota"
 
-    def test_name_too_short(
-        self,
-        legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
-    ):
-        """Test that an empty name returns the expected validation result."""
-        legacy_otu["name"] = "Iota"
-
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
-
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
-                "[bold]name[/bold] must be a string with a minimum length of 5. "
-                "it currently has a length of [u]4[/u].",
-                False,
-            ),
-        ]
 
-        assert otu_result.repaired_otu == legacy_otu
+def _empty_schema(otu: dict) -> None:
+    """Empty the schema."""
+    otu["schema"] = []
 
-    def test_empty_schema(self, legacy_otu: dict, scratch_ncbi_client: NCBIClient):
-        """Test that an empty schema raises a ValueError."""
-        legacy_otu["schema"] = []
 
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
+def _remove_required_sequence(otu: dict) -> None:
+    """Remove a sequence for a required schema segment from the first isolate."""
+    otu["isolates"][0]["sequences"].pop()
 
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
-                "[bold]schema[/bold] must be a List with a minimum length of 1. "
-                "it currently has a length of [u]0[/u].",
-                False,
-            ),
-        ]
 
-        assert otu_result.repaired_otu == legacy_otu
+def _set_invalid_segment_name(otu: dict) -> None:
+    """Give a sequence a segment name that is not defined in the OTU schema."""
+    otu["isolates"][0]["sequences"][0]["segment"] = "DNA Invalid"
 
-    def test_missing_segment(
-        self,
-        legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
-    ):
-        """Test that validation fails if an isolate is missing a required sequence
-        segment defined in the OTU schema.
-        """
-        legacy_otu["isolates"][0]["sequences"].pop()
 
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
+def _duplicate_schema_segment(otu: dict) -> None:
+    """Add a segment with a duplicate name to the schema."""
+    otu["schema"].append(otu["schema"][0])
 
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
-                "isolate does not contain all required schema segments",
-                False,
-            ),
-        ]
 
-        assert otu_result.repaired_otu == legacy_otu
+def _set_inconsistent_molecule(otu: dict) -> None:
+    """Give schema segments different values for their ``molecule`` fields."""
+    otu["schema"][0]["molecule"] = "DNA"
 
-    def test_invalid_sequence_segment_name(
-        self,
-        legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
-    ):
-        """Test that validation fails if an isolate has a sequence with a name that is
-        not defined in the OTU schema.
-        """
-        legacy_otu["isolates"][0]["sequences"][0]["segment"] = "DNA Invalid"
 
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
+def _set_two_default_isolates(otu: dict) -> None:
+    """Make more than one isolate default."""
+    otu["isolates"][0]["default"] = True
+    otu["isolates"][1]["default"] = True
 
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
-                "sequence contains invalid segment name",
-                False,
-            ),
-        ]
 
-        assert otu_result.repaired_otu == legacy_otu
+def _unset_default_isolates(otu: dict) -> None:
+    """Make no isolate default."""
+    otu["isolates"][0]["default"] = False
+    otu["isolates"][1]["default"] = False
 
-    def test_duplicate_segment_name(
-        self,
-        legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
-    ):
-        """Test that validation fails when an OTU has a segment with a duplicate name in
-        its schema.
-        """
-        legacy_otu["schema"].append(legacy_otu["schema"][0])
 
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
+class TestOTU:
+    """Test handlers for OTU validation."""
 
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
+    @pytest.mark.parametrize(
+        ("mutate", "message"),
+        [
+            pytest.param(
+                _set_short_name,
+                "[bold]name[/bold] must be a string with a minimum length of 5. "
+                "it currently has a length of [u]4[/u].",
+                id="name_too_short",
+            ),
+            pytest.param(
+                _empty_schema,
+                "[bold]schema[/bold] must be a List with a minimum length of 1. "
+                "it currently has a length of [u]0[/u].",
+                id="empty_schema",
+            ),
+            pytest.param(
+                _remove_required_sequence,
+                "isolate does not contain all required schema segments",
+                id="missing_segment",
+            ),
+            pytest.param(
+                _set_invalid_segment_name,
+                "sequence contains invalid segment name",
+                id="invalid_sequence_segment_name",
+            ),
+            pytest.param(
+                _duplicate_schema_segment,
                 "All schema segments must have a unique name",
-                False,
+                id="duplicate_segment_name",
             ),
-        ]
-
-        assert otu_result.repaired_otu == legacy_otu
-
-    def test_molecule_inconsistency(
-        self,
-        legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
-    ):
-        """Test that validation fails when an OTU has segments with different values
-        for their ``molecule`` fields.
-        """
-        legacy_otu["schema"][0]["molecule"] = "DNA"
-
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
-
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
+            pytest.param(
+                _set_inconsistent_molecule,
                 "All segments in a schema must have the same molecule",
-                False,
+                id="molecule_inconsistency",
             ),
-        ]
-
-        assert otu_result.repaired_otu == legacy_otu
-
-    def test_too_many_default_isolates(
-        self,
-        legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
-    ):
-        """Test that validation fails when an OTU has more than one default isolate."""
-        legacy_otu["isolates"][0]["default"] = True
-        legacy_otu["isolates"][1]["default"] = True
-
-        otu_result = validate_legacy_otu(
-            False,
-            scratch_ncbi_client,
-            legacy_otu,
-        )
-
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
+            pytest.param(
+                _set_two_default_isolates,
                 "Only one isolate can be default",
-                False,
+                id="too_many_default_isolates",
             ),
-        ]
-
-        assert otu_result.repaired_otu == legacy_otu
-
-    def test_no_default_isolate(
+            pytest.param(
+                _unset_default_isolates,
+                "At least one isolate must be default",
+                id="no_default_isolate",
+            ),
+        ],
+    )
+    def test_invalid(
         self,
+        mutate: Callable[[dict], None],
+        message: str,
         legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
     ):
-        """Test that validation fails when an OTU has no default isolate."""
-        legacy_otu["isolates"][0]["default"] = False
-        legacy_otu["isolates"][1]["default"] = False
+        """Test that an invalid OTU returns the expected, unfixed validation result."""
+        mutate(legacy_otu)
 
         otu_result = validate_legacy_otu(
             False,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
 
-        assert otu_result.handler_results == [
-            ErrorHandledResult(
-                "At least one isolate must be default",
-                False,
-            ),
-        ]
-
+        assert otu_result.handler_results == [ErrorHandledResult(message, False)]
         assert otu_result.repaired_otu == legacy_otu
 
 
 class TestIsolate:
     """Test handlers for isolate validation."""
 
-    @pytest.mark.ncbi()
     @pytest.mark.parametrize("fix", [True, False], ids=["fix", "no_fix"])
     def test_source_type_invalid(
         self,
         fix: bool,
         legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
     ):
         """Test that an invalid source type raises a ValueError when auto-fix is
         disabled.
@@ -234,7 +151,7 @@ class TestIsolate:
 
         otu_result = validate_legacy_otu(
             fix,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
 
@@ -252,13 +169,12 @@ class TestIsolate:
         else:
             assert otu_result.repaired_otu["isolates"][0]["source_type"] == "invalid"
 
-    @pytest.mark.ncbi()
     @pytest.mark.parametrize("fix", [True, False], ids=["fix", "no_fix"])
     def test_source_name_empty(
         self,
         fix: bool,
         legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
     ):
         """Test handling of empty source names.
 
@@ -270,7 +186,7 @@ class TestIsolate:
 
         otu_result = validate_legacy_otu(
             fix,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
 
@@ -287,7 +203,6 @@ class TestIsolate:
         else:
             assert otu_result.repaired_otu == legacy_otu
 
-    @pytest.mark.ncbi()
     def test_source_name_empty_failed_fix(
         self,
         mocker: MockerFixture,
@@ -319,14 +234,14 @@ class TestIsolate:
         self,
         fix: bool,
         legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
     ):
         """Test that an isolate with no sequences raises a ValueError."""
         legacy_otu["isolates"][0]["sequences"] = []
 
         otu_result = validate_legacy_otu(
             fix,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
 
@@ -342,13 +257,12 @@ class TestIsolate:
 class TestSequence:
     """Test handlers for sequence validation."""
 
-    @pytest.mark.ncbi()
     @pytest.mark.parametrize("fix", [True, False], ids=["fix", "no_fix"])
     def test_invalid_accession(
         self,
         fix: bool,
         legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
     ):
         """Test that validation fails when an isolate has a sequence containing invalid
         characters.
@@ -357,7 +271,7 @@ class TestSequence:
 
         otu_result = validate_legacy_otu(
             fix,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
 
@@ -390,7 +304,7 @@ class TestSequence:
         field: str,
         input_: str,
         legacy_otu: dict,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
     ):
         """Test that a sequence with a definition that is too short raises a
         ValueError.
@@ -399,7 +313,7 @@ class TestSequence:
 
         otu_result = validate_legacy_otu(
             False,
-            scratch_ncbi_client,
+            module_scratch_ncbi_client,
             legacy_otu,
         )
 
@@ -1,9 +1,8 @@
-import json
-from io import StringIO
+from collections.abc import Callable
 from pathlib import Path
 
+import orjson
 import pytest
-from pytest_mock import MockerFixture
 from rich.console import Console
 
 from ref_builder.legacy.repo import (
@@ -12,20 +11,19 @@ from ref_builder.legacy.repo import (
 )
 
 
-@pytest.fixture()
-def _console(mocker: MockerFixture) -> Console:
-    """The console object in the legacy console module.
+@pytest.fixture(scope="module")
+def module_console(patch_console: Callable[[str, int], Console]) -> Console:
+    """Patch the console in the legacy repo module for all tests in this module."""
+    return patch_console("ref_builder.legacy.repo.console", 100)
 
-    Patched to use a StringIO file instead of stdout.
-    """
-    console = Console(file=StringIO())
-    mocker.patch("ref_builder.legacy.repo.console", console)
 
-    return console
+def _update_json(path: Path, **update: object) -> None:
+    """Update top-level fields in the JSON object stored at ``path``."""
+    path.write_bytes(orjson.dumps({**orjson.loads(path.read_bytes()), **update}))
 
 
 def test_check_unique_accessions(
-    _console: Console,
+    console: Console,
     legacy_otu: dict,
     legacy_repo_path: Path,
 ):
@@ -36,38 +34,28 @@ def test_check_unique_accessions(
         src_path / "b" / "bamboo_mosaic_virus" / "lm3xmhrf" / "3d2e72sk.json"
     )
 
-    with open(sequence_path) as f:
-        data = json.load(f)
-
     duplicate_accession = legacy_otu["isolates"][0]["sequences"][0]["accession"]
 
-    with open(sequence_path, "w") as f:
-        json.dump(
-            {
-                **data,
-                "accession": duplicate_accession,
-            },
-            f,
-        )
+    _update_json(sequence_path, accession=duplicate_accession)
 
     check_unique_accessions(legacy_repo_path)
 
     assert (
-        f"Found non-unique accession: {duplicate_accession}" in _console.file.getvalue()
+        f"Found non-unique accession: {duplicate_accession}" in console.file.getvalue()
     )
 
 
 class TestCheckUniqueOTUNamesAndAbbreviations:
     def test_ok(
         self,
-        _console: Console,
+        console: Console,
         legacy_repo_path: Path,
     ):
         """Test that validation passes when all OTU abbreviations and names are
         unique.
         """
         check_unique_otu_abbreviations_and_names(legacy_repo_path)
-        assert _console.file.getvalue() == ""
+        assert console.file.getvalue() == ""
 
     @pytest.mark.parametrize("abbreviation", ["ABTV", "BaMV"])
     @pytest.mark.parametrize(
@@ -78,30 +66,21 @@ class TestCheckUniqueOTUNamesAndAbbreviations:
         self,
         abbreviation: str,
         name: str,
-        _console: Console,
+        console: Console,
         legacy_repo_path: Path,
     ):
         """Test that check_unique_otu_abbreviations_and_names() finds non-unique OTU
         abbreviations.
         """
-        json_path = legacy_repo_path / "src" / "b" / "bamboo_mosaic_virus" / "otu.json"
-
-        with open(json_path) as f:
-            data = json.load(f)
-
-        with open(json_path, "w") as f:
-            json.dump(
-                {
-                    **data,
-                    "abbreviation": abbreviation,
-                    "name": name,
-                },
-                f,
-            )
+        _update_json(
+            legacy_repo_path / "src" / "b" / "bamboo_mosaic_virus" / "otu.json",
+            abbreviation=abbreviation,
+            name=name,
+        )
 
         check_unique_otu_abbreviations_and_names(legacy_repo_path)
 
-        logs = _console.file.getvalue()
+        logs = console.file.getvalue()
 
         if abbreviation == "ABTV":
             assert "Found non-unique OTU abbreviation: ABTV" in logs
@@ -114,25 +93,13 @@ class TestCheckUniqueOTUNamesAndAbbreviations:
 
     def test_empty_abbreviation(
         self,
-        _console: Console,
+        console: Console,
         legacy_repo_path: Path,
     ):
         """Test that check passes for duplicate empty abbreviations."""
         for path in (Path("b/bamboo_mosaic_virus"), Path("o/oat_blue_dwarf_virus")):
-            json_path = legacy_repo_path / "src" / path / "otu.json"
-
-            with open(json_path) as f:
-                data = json.load(f)
-
-            with open(json_path, "w") as f:
-                json.dump(
-                    {
-                        **data,
-                        "abbreviation": "",
-                    },
-                    f,
-                )
+            _update_json(legacy_repo_path / "src" / path / "otu.json", abbreviation="")
 
         check_unique_otu_abbreviations_and_names(legacy_repo_path)
 
-        assert _console.file.getvalue() == ""
+        assert console.file.getvalue() == ""
@@ -5,6 +5,7 @@ import pytest
 
 from ref_builder.legacy.utils import (
     build_legacy_otu,
+    iter_legacy_otu_metadata,
     iter_legacy_otus,
     replace_otu,
 )
@@ -15,6 +16,18 @@ def test_iter_legacy_otu(legacy_repo_path: Path):
     list(iter_legacy_otus(legacy_repo_path / "src"))
 
 
+def test_iter_legacy_otu_metadata(legacy_repo_path: Path):
+    """Test that OTU metadata is yielded for every OTU, in the same order and without
+    isolates.
+    """
+    src_path = legacy_repo_path / "src"
+
+    assert list(iter_legacy_otu_metadata(src_path)) == [
+        {key: value for key, value in otu.items() if key != "isolates"}
+        for otu in iter_legacy_otus(src_path)
+    ]
+
+
 class TestReplaceOTU:
     """Test the replace_otu() function."""
 
@@ -1,10 +1,19 @@
+from collections.abc import Callable
+
 import pytest
+from rich.console import Console
 
 from ref_builder.legacy.utils import ErrorHandledResult
 from ref_builder.legacy.validate import OTUValidationResult, log_otu_validation_result
 
 
-def test_log_ok(capfd, mocker):
+@pytest.fixture(scope="module")
+def module_console(patch_console: Callable[[str, int], Console]) -> Console:
+    """Patch the console in the legacy validate module for all tests in this module."""
+    return patch_console("ref_builder.legacy.validate.console", 80)
+
+
+def test_log_ok(console: Console):
     """Test that the console logs OK when validation passes."""
     result = OTUValidationResult(
         handler_results=[],
@@ -13,7 +22,7 @@ def test_log_ok(capfd, mocker):
 
     log_otu_validation_result("Test virus", result, False)
 
-    assert capfd.readouterr().out == (
+    assert console.file.getvalue() == (
         "Test virus "
         "─────────────────────────────────────────────────────────────────────\n\n"
         "  ‣ OK                                                                   "
@@ -21,7 +30,7 @@ def test_log_ok(capfd, mocker):
     )
 
 
-def test_log_no_ok(capfd):
+def test_log_no_ok(console: Console):
     """Test that the console logs nothing when the validation passes and ``no_ok`` is
     set.
     """
@@ -32,11 +41,11 @@ def test_log_no_ok(capfd):
 
     log_otu_validation_result("Test virus", result, True)
 
-    assert capfd.readouterr().out == ""
+    assert console.file.getvalue() == ""
 
 
 @pytest.mark.parametrize("no_ok", [False, True])
-def test_log_error_single(no_ok: bool, capfd):
+def test_log_error_single(no_ok: bool, console: Console):
     """Test that the console logs OK correctly."""
     result = OTUValidationResult(
         handler_results=[
@@ -50,7 +59,7 @@ def test_log_error_single(no_ok: bool, capfd):
 
     log_otu_validation_result("Test virus", result, no_ok)
 
-    assert capfd.readouterr().out == (
+    assert console.file.getvalue() == (
         "Test virus "
         "─────────────────────────────────────────────────────────────────────\n\n"
         "  ‣ [ERROR] Error message                                                "
@@ -59,7 +68,7 @@ def test_log_error_single(no_ok: bool, capfd):
 
 
 @pytest.mark.parametrize("no_ok", [False, True])
-def test_log_error_multi(no_ok: bool, capfd):
+def test_log_error_multi(no_ok: bool, console: Console):
     """Test that the console logs OK correctly."""
     result = OTUValidationResult(
         handler_results=[
@@ -77,7 +86,7 @@ def test_log_error_multi(no_ok: bool, capfd):
 
     log_otu_validation_result("Test virus", result, no_ok)
 
-    assert capfd.readouterr().out == (
+    assert console.file.getvalue() == (
         "Test virus "
         "─────────────────────────────────────────────────────────────────────\n\n"
         "  ‣ [ERROR] There was a problem                                          "
@@ -88,7 +97,7 @@ def test_log_error_multi(no_ok: bool, capfd):
 
 
 @pytest.mark.parametrize("no_ok", [False, True])
-def test_log_error_fixed(no_ok: bool, capfd):
+def test_log_error_fixed(no_ok: bool, console: Console):
     """Test that the console logs OK correctly."""
     result = OTUValidationResult(
         handler_results=[
@@ -102,7 +111,7 @@ def test_log_error_fixed(no_ok: bool, capfd):
 
     log_otu_validation_result("Test virus", result, no_ok)
 
-    assert capfd.readouterr().out == (
+    assert console.file.getvalue() == (
         "Test virus "
         "─────────────────────────────────────────────────────────────────────\n\n"
         "  ‣ [FIXED] A fixable problem occurred                                   "
@@ -1,4 +1,9 @@
+import os
+import shutil
+from pathlib import Path
+
 import pytest
+from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
 from ref_builder.ncbi.cache import NCBICache
@@ -14,13 +19,37 @@ def test_clear(scratch_ncbi_cache: NCBICache):
     genbank_path = scratch_ncbi_cache.path / "genbank"
     taxonomy_path = scratch_ncbi_cache.path / "taxonomy"
 
-    assert len(list(genbank_path.glob("*.json"))) == 76
-    assert len(list(taxonomy_path.glob("*.json"))) == 26
+    assert len(os.listdir(genbank_path)) == 76
+    assert len(os.listdir(taxonomy_path)) == 26
+
+    scratch_ncbi_cache.clear()
+
+    assert len(os.listdir(genbank_path)) == 0
+    assert len(os.listdir(taxonomy_path)) == 0
+
+
+def test_clear_skips_directories(scratch_ncbi_cache: NCBICache):
+    """Test that clearing the cache removes cached files without failing on
+    directories in the cache directories.
+    """
+    genbank_path = scratch_ncbi_cache.path / "genbank"
+
+    (genbank_path / "unexpected").mkdir()
+
+    scratch_ncbi_cache.clear()
+
+    assert os.listdir(genbank_path) == ["unexpected"]
+    assert os.listdir(scratch_ncbi_cache.path / "taxonomy") == []
+
+
+def test_clear_missing_directories(scratch_ncbi_cache: NCBICache):
+    """Test that clearing the cache recreates cache directories that were removed."""
+    shutil.rmtree(scratch_ncbi_cache.path)
 
     scratch_ncbi_cache.clear()
 
-    assert len(list(genbank_path.glob("*.json"))) == 0
-    assert len(list(taxonomy_path.glob("*.json"))) == 0
+    assert os.listdir(scratch_ncbi_cache.path / "genbank") == []
+    assert os.listdir(scratch_ncbi_cache.path / "taxonomy") == []
 
 
 class TestGenbank:
@@ -69,10 +98,56 @@ class TestGenbank:
 
         assert scratch_ncbi_cache.load_genbank_record("FJ028650") == v_2
 
+    def test_cache_multi_digit_version_retrieve(self, scratch_ncbi_cache: NCBICache):
+        """Test that the latest version is compared numerically, so version 10 is
+        loaded ahead of version 9.
+        """
+        scratch_ncbi_cache.cache_genbank_record({"version": 9}, "FJ028650", 9)
+        scratch_ncbi_cache.cache_genbank_record({"version": 10}, "FJ028650", 10)
+
+        assert scratch_ncbi_cache.load_genbank_record("FJ028650") == {"version": 10}
+
     def test_load_not_found(self, scratch_ncbi_cache: NCBICache):
         """Test that None is returned if a record is not found."""
         assert scratch_ncbi_cache.load_genbank_record("not_found") is None
 
+    def test_cache_replaces_file(self, scratch_ncbi_cache: NCBICache, tmp_path: Path):
+        """Test that caching a record replaces an existing cache file instead of writing
+        to it in place, leaving hard links to the old file unchanged.
+        """
+        path = scratch_ncbi_cache.path / "genbank" / "AB017504_1.json"
+        link_path = tmp_path / "AB017504_1.json"
+
+        os.link(path, link_path)
+
+        original = link_path.read_bytes()
+
+        scratch_ncbi_cache.cache_genbank_record({"foo": "bar"}, "AB017504", 1)
+
+        assert scratch_ncbi_cache.load_genbank_record("AB017504", 1) == {"foo": "bar"}
+        assert link_path.read_bytes() == original
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_cache_failed_write(
+        self,
+        mocker: MockerFixture,
+        scratch_ncbi_cache: NCBICache,
+    ):
+        """Test that a failed write leaves the existing cache file unchanged and removes
+        the temporary file.
+        """
+        path = scratch_ncbi_cache.path / "genbank" / "AB017504_1.json"
+
+        original = path.read_bytes()
+
+        mocker.patch.object(Path, "replace", side_effect=OSError("Replace failed"))
+
+        with pytest.raises(OSError, match="Replace failed"):
+            scratch_ncbi_cache.cache_genbank_record({"foo": "bar"}, "AB017504", 1)
+
+        assert path.read_bytes() == original
+        assert not list(path.parent.glob("*.tmp"))
+
 
 class TestTaxonomy:
     """Test the caching and loading of taxonomy records."""
@@ -1,6 +1,7 @@
 import datetime
 
 import pytest
+from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
 from ref_builder.ncbi.client import NCBIClient
@@ -40,6 +41,31 @@ class TestFetchGenbank:
             == snapshot
         )
 
+    def test_fetch_versioned_genbank_records_from_cache(
+        self,
+        mocker: MockerFixture,
+        scratch_ncbi_client: NCBIClient,
+    ):
+        """Test that versioned accessions are loaded from the cache instead of being
+        fetched from NCBI.
+        """
+        fetch = mocker.patch(
+            "ref_builder.ncbi.client.NCBIClient.fetch_unvalidated_genbank_records",
+            return_value=[],
+        )
+
+        records = scratch_ncbi_client.fetch_genbank_records(
+            ["NC_010317.1", "FJ028650.2", "NC_036587.1"],
+        )
+
+        fetch.assert_not_called()
+
+        assert [record.accession_version for record in records] == [
+            "FJ028650.2",
+            "NC_010317.1",
+            "NC_036587.1",
+        ]
+
     @pytest.mark.ncbi()
     def test_fetch_partially_cached_genbank_records(
         self,
@@ -14,40 +14,40 @@ class TestParseGenbank:
     def test_ok(
         self,
         accession: str,
-        scratch_ncbi_cache: NCBICache,
+        module_scratch_ncbi_cache: NCBICache,
         snapshot: SnapshotAssertion,
     ):
         """Test that multiple valid records can be parsed successfully."""
-        record = scratch_ncbi_cache.load_genbank_record(accession)
-        assert NCBIGenbank(**record).model_dump() == snapshot
+        record = module_scratch_ncbi_cache.load_genbank_record(accession)
+        assert NCBIGenbank.model_validate(record).model_dump() == snapshot
 
     def test_source(
         self,
-        scratch_ncbi_cache: NCBICache,
+        module_scratch_ncbi_cache: NCBICache,
         snapshot: SnapshotAssertion,
     ):
         """Test that the source table is correctly extracted from the feature table."""
-        record = scratch_ncbi_cache.load_genbank_record("AB017504")
-        assert NCBIGenbank(**record).source.model_dump() == snapshot
+        record = module_scratch_ncbi_cache.load_genbank_record("AB017504")
+        assert NCBIGenbank.model_validate(record).source.model_dump() == snapshot
 
     def test_taxid(
         self,
-        scratch_ncbi_cache,
+        module_scratch_ncbi_cache: NCBICache,
     ):
         """Test that the taxid is correctly extracted from the source field."""
-        record = scratch_ncbi_cache.load_genbank_record("AB017504")
-        assert NCBIGenbank(**record).source.taxid == 1169032
+        record = module_scratch_ncbi_cache.load_genbank_record("AB017504")
+        assert NCBIGenbank.model_validate(record).source.taxid == 1169032
 
-    def test_sequence_validation_fail(self, scratch_ncbi_cache: NCBICache):
+    def test_sequence_validation_fail(self, module_scratch_ncbi_cache: NCBICache):
         """Test that validation fails when the sequence contains invalid characters."""
-        record = scratch_ncbi_cache.load_genbank_record("AB017504")
+        record = module_scratch_ncbi_cache.load_genbank_record("AB017504")
 
-        assert NCBIGenbank(**record)
+        assert NCBIGenbank.model_validate(record)
 
         record["GBSeq_sequence"] = "naa"
 
         try:
-            NCBIGenbank(**record)
+            NCBIGenbank.model_validate(record)
         except ValidationError as exc:
             for error in exc.errors():
                 assert "GBSeq_sequence" in error["loc"]
@@ -58,28 +58,28 @@ class TestParseTaxonomy:
     def test_ok(
         self,
         taxid: int,
-        scratch_ncbi_cache: NCBICache,
+        module_scratch_ncbi_cache: NCBICache,
         snapshot: SnapshotAssertion,
     ):
         """Test that multiple valid records can be parsed successfully."""
-        record = scratch_ncbi_cache.load_taxonomy(taxid)
+        record = module_scratch_ncbi_cache.load_taxonomy(taxid)
 
-        taxonomy = NCBITaxonomy(**record)
+        taxonomy = NCBITaxonomy.model_validate(record)
 
         assert type(taxonomy) is NCBITaxonomy
         assert taxonomy.model_dump() == snapshot
 
     def test_with_rank(
         self,
-        scratch_ncbi_cache: NCBICache,
+        module_scratch_ncbi_cache: NCBICache,
         snapshot: SnapshotAssertion,
     ):
         """Test that the rank field can be explicitly set using a kwarg in the case that
         it is not present in the record.
         """
-        record = scratch_ncbi_cache.load_taxonomy(1016856)
+        record = module_scratch_ncbi_cache.load_taxonomy(1016856)
 
-        assert NCBITaxonomy(**record).rank == NCBIRank.NO_RANK
+        assert NCBITaxonomy.model_validate(record).rank == NCBIRank.NO_RANK
 
         taxonomy = NCBITaxonomy(rank=NCBIRank.ISOLATE, **record)
 
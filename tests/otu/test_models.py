@@ -3,6 +3,7 @@
 import uuid
 
 import pytest
+from polyfactory.factories.pydantic_factory import ModelFactory
 
 from ref_builder.otu.models import OTU, OTUBase
 from tests.fixtures.factories import OTUFactory
@@ -13,9 +14,19 @@ class TestOTU:
 
     otu: OTUBase
 
+    @pytest.fixture(scope="class")
+    def otu_template(self, factory_seed: int) -> OTUBase:
+        """Build an OTU once for the class.
+
+        Seeded the same way as the function-scoped factories. Do not mutate.
+        """
+        ModelFactory.seed_random(factory_seed)
+
+        return OTUFactory.build()
+
     @pytest.fixture(autouse=True)
-    def _build_otu(self, otu_factory: OTUFactory):
-        self.otu = otu_factory.build()
+    def _build_otu(self, otu_template: OTUBase):
+        self.otu = otu_template.model_copy(deep=True)
 
     def test_ok(self):
         """Test that a valid OTU passes validation."""
@@ -1,3 +1,6 @@
+from collections.abc import Callable
+from pathlib import Path
+
 import pytest
 from syrupy import SnapshotAssertion
 from syrupy.filters import props
@@ -13,16 +16,29 @@ from tests.fixtures.factories import NCBIGenbankFactory, NCBISourceFactory
 from tests.fixtures.utils import uuid_matcher
 
 
+@pytest.fixture(scope="module")
+def scratch_repo(
+    build_scratch_repo: Callable[[Path], Repo],
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Repo:
+    """Return a prepared scratch repository, shared by the module.
+
+    Overrides the function-scoped fixture in ``conftest.py``. Tests in this module only
+    read OTUs from the repository.
+    """
+    return build_scratch_repo(tmp_path_factory.mktemp("scratch_repo"))
+
+
 class TestCreatePlanFromRecords:
     """Test `create_plan_from_records` function."""
 
     def test_monopartite(
         self,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
         snapshot: SnapshotAssertion,
     ):
         """Test that a monopartite plan is created from a single Genbank record."""
-        records = scratch_ncbi_client.fetch_genbank_records(["NC_024301"])
+        records = module_scratch_ncbi_client.fetch_genbank_records(["NC_024301"])
 
         plan = create_plan_from_records(records, length_tolerance=0.03)
 
@@ -31,11 +47,11 @@ class TestCreatePlanFromRecords:
 
     def test_multipartite(
         self,
-        scratch_ncbi_client: NCBIClient,
+        module_scratch_ncbi_client: NCBIClient,
         snapshot: SnapshotAssertion,
     ):
         """Test that a multipartite plan is created from multiple Genbank records."""
-        records = scratch_ncbi_client.fetch_genbank_records(
+        records = module_scratch_ncbi_client.fetch_genbank_records(
             [
                 "NC_010314",
                 "NC_010315",
@@ -56,9 +72,9 @@ class TestCreatePlanFromRecords:
         # Make sure the segment names are ordered alphabetically.
         assert segment_names == sorted(segment_names)
 
-    def test_numeric_sorting(self, scratch_ncbi_client: NCBIClient):
+    def test_numeric_sorting(self, module_scratch_ncbi_client: NCBIClient):
         """Test that segment names are sorted numerically."""
-        records = scratch_ncbi_client.fetch_genbank_records(
+        records = module_scratch_ncbi_client.fetch_genbank_records(
             ["NC_010314", "NC_010315", "NC_010316"]
         )
 
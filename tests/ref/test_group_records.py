@@ -25,10 +25,7 @@ class TestGroupRecords:
         grouped_records = group_genbank_records_by_isolate(records)
 
         assert grouped_records
-
-        for source_key in grouped_records:
-            assert source_key == snapshot
-            assert grouped_records[source_key] == snapshot
+        assert grouped_records == snapshot
 
     @pytest.mark.parametrize("accessions", [["Y11023"]])
     def test_group_records_by_isolate_failure(self, accessions, scratch_ncbi_client):
@@ -1,6 +1,5 @@
 """Tests for data factories used in testing."""
 
-import uuid
 from uuid import uuid4
 
 from syrupy import SnapshotAssertion
@@ -32,21 +31,23 @@ def test_ncbi_genbank_factory(
     """Test that NCBIGenbankFactory creates valid fake Genbank records."""
     records = list(ncbi_genbank_factory.coverage())
 
-    assert [
-        RepoSequence(
-            id=uuid4(),
-            accession=Accession.from_string(record.accession_version),
-            definition=record.definition,
-            legacy_id=None,
-            segment=uuid.uuid4(),
-            sequence=record.sequence,
-        )
-        for record in records
-    ]
-
     assert [record.model_dump() for record in records] == snapshot
 
 
+def test_ncbi_genbank_factory_repo_sequence(ncbi_genbank_factory: NCBIGenbankFactory):
+    """Test that a fake Genbank record can be used to build a valid RepoSequence."""
+    record = ncbi_genbank_factory.build()
+
+    assert RepoSequence(
+        id=uuid4(),
+        accession=Accession.from_string(record.accession_version),
+        definition=record.definition,
+        legacy_id=None,
+        segment=uuid4(),
+        sequence=record.sequence,
+    )
+
+
 def test_sequence_factory(sequence_factory: SequenceFactory):
     """Test that SequenceFactory creates valid mock sequence data."""
     assert all(
@@ -179,7 +179,7 @@ class TestCreateOTU:
                 isolates=[],
             )
 
-            with open(empty_repo.path.joinpath("src", "00000002.json")) as f:
+            with open(empty_repo.path.joinpath("src", "00000002.json"), "rb") as f:
                 event = orjson.loads(f.read())
 
             del event["timestamp"]
@@ -342,7 +342,7 @@ class TestCreateIsolate:
             assert isolate.name.value == "A"
             assert isolate.name.type == "isolate"
 
-            with open(empty_repo.path.joinpath("src", "00000003.json")) as f:
+            with open(empty_repo.path.joinpath("src", "00000003.json"), "rb") as f:
                 event = orjson.loads(f.read())
 
             del event["timestamp"]
@@ -423,7 +423,7 @@ def test_create_sequence(empty_repo: Repo):
             sequence="ACGTACGTACGTACG",
         )
 
-        with open(empty_repo.path.joinpath("src", "00000003.json")) as f:
+        with open(empty_repo.path.joinpath("src", "00000003.json"), "rb") as f:
             event = orjson.loads(f.read())
 
         del event["timestamp"]
@@ -765,7 +765,8 @@ class TestExcludeAccessions:
         assert initialized_repo.last_id == id_at_creation + 1 == 7
 
         with open(
-            initialized_repo.path / "src" / f"{initialized_repo.last_id:08}.json"
+            initialized_repo.path / "src" / f"{initialized_repo.last_id:08}.json",
+            "rb",
         ) as f:
             event = orjson.loads(f.read())
 
@@ -811,7 +812,8 @@ class TestExcludeAccessions:
         assert initialized_repo.get_otu_by_taxid(12242).excluded_accessions == set()
 
         with open(
-            initialized_repo.path / "src" / f"{initialized_repo.last_id:08}.json"
+            initialized_repo.path / "src" / f"{initialized_repo.last_id:08}.json",
+            "rb",
         ) as f:
             event = orjson.loads(f.read())
 
@@ -868,7 +870,7 @@ class TestExcludeAccessions:
             otu_before.excluded_accessions | {"TM100024"}
         )
 
-        with open(repo.path.joinpath("src", f"{repo.last_id:08}.json")) as f:
+        with open(repo.path.joinpath("src", f"{repo.last_id:08}.json"), "rb") as f:
             event = orjson.loads(f.read())
 
         del event["timestamp"]
@@ -919,7 +921,8 @@ class TestAllowAccessions:
         otu_after = target_repo.get_otu(otu.id)
 
         with open(
-            target_repo.path.joinpath("src", f"0000000{target_repo.last_id}.json")
+            target_repo.path.joinpath("src", f"0000000{target_repo.last_id}.json"),
+            "rb",
         ) as f:
             event = orjson.loads(f.read())
 